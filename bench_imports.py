@@ -0,0 +1,75 @@
+"""Import-time benchmark for solver-only startup.
+
+Fails (exit code 1) if importing the headless modules pulls in the browser
+stack or takes longer than the budget. Run: python bench_imports.py
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+# Modules a solver-only / batch job imports
+HEADLESS_MODULES = ["models", "solver", "dispatcher", "worker"]
+
+# Must only load on the first live solve
+FORBIDDEN_PREFIXES = ("selenium", "webdriver_manager", "extractor", "tkinter")
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure_import(modules, runs: int = 5):
+    """Import modules in fresh interpreters; return (best_ms, loaded_modules)."""
+    code = (
+        "import sys\n"
+        f"for _m in {modules!r}: __import__(_m)\n"
+        "print('\\n'.join(sys.modules))\n"
+    )
+    best_us = None
+    loaded = set()
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=HERE, capture_output=True, text=True, check=True,
+        )
+        loaded = set(proc.stdout.split())
+        total_us = 0
+        for line in proc.stderr.splitlines():
+            # "import time: self [us] | cumulative | imported package"
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if name.strip() in modules and not name.startswith(" " * 2):
+                total_us += int(cumulative)
+        if best_us is None or total_us < best_us:
+            best_us = total_us
+    return best_us / 1000, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget-ms", type=float, default=100.0,
+                        help="Max cumulative import time for headless modules")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    elapsed_ms, loaded = measure_import(HEADLESS_MODULES, args.runs)
+    leaked = sorted(m for m in loaded if m.startswith(FORBIDDEN_PREFIXES))
+
+    print(f"Headless import ({', '.join(HEADLESS_MODULES)}): {elapsed_ms:.1f} ms "
+          f"(budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    if leaked:
+        print(f"❌ Browser/UI modules loaded at import: {leaked}")
+        failed = True
+    if elapsed_ms > args.budget_ms:
+        print(f"❌ Import time regressed: {elapsed_ms:.1f} ms > {args.budget_ms:.0f} ms")
+        failed = True
+    if not failed:
+        print("✅ Solver-only startup OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,410 @@
+"""Solver benchmark suite with regression gates.
+
+    python benchmark.py                     # run corpus, compare to baseline
+    python benchmark.py --update-baseline   # accept current numbers
+    python benchmark.py --build-corpus      # regenerate corpus (bump CORPUS_VERSION first)
+    python benchmark.py --fit-table         # re-fit the dispatcher's selection table
+
+Exit code 1 on an invalid/missing solution, more capped solves than the
+baseline or a regression beyond thresholds.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from dispatcher import (
+    build_solver, config_to_dict, fit_selection_table, puzzle_features, save_selection_table,
+    select_config, TABLE_PATH,
+)
+from generator import generate_puzzle, mixing_steps
+from models import GridParseResult, SolverConfig
+from solver import ZipSolverCore, ENGINES, ORDERINGS, PROGRESS_INTERVAL
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BENCH_DIR = os.path.join(HERE, "benchmarks")
+
+CORPUS_VERSION = 3
+CORPUS_PATH = os.path.join(BENCH_DIR, f"corpus_v{CORPUS_VERSION}.json")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+RESULTS_PATH = os.path.join(HERE, "bench_results.json")
+
+# Corpus layout: size x wall density x checkpoint count, PUZZLES_PER_BUCKET each
+SIZES = (5, 6, 7, 8, 9)
+WALL_LEVELS = {"open": 0.0, "walled": 0.2}
+CHECKPOINT_LEVELS = {"few": 0.12, "many": 0.3}  # fraction of cells
+PUZZLES_PER_BUCKET = 20
+# Nearly every board exceeds the node cap: no timing signal, only run time
+SKIP_BUCKETS = {"9x9|open|few"}
+
+# Per-solve node budget (checked every PROGRESS_INTERVAL nodes); a capped
+# solve counts as a failure. Nodes, unlike seconds, do not depend on load.
+DEFAULT_NODE_CAP = 40 * PROGRESS_INTERVAL
+
+# Configurations tried by --fit-table
+PRUNING_SETS = ((), ("dead_end",), ("connectivity",), ("dead_end", "connectivity"))
+
+
+# -------------------------------------------------------
+# CORPUS
+# -------------------------------------------------------
+def build_corpus() -> Dict:
+    """Generate the corpus from fixed seeds."""
+    puzzles = []
+    seed = 0
+    for size in SIZES:
+        for wall_name, wall_density in WALL_LEVELS.items():
+            for cp_name, cp_frac in CHECKPOINT_LEVELS.items():
+                bucket = f"{size}x{size}|{wall_name}|{cp_name}"
+                if bucket in SKIP_BUCKETS:
+                    continue
+                checkpoints = max(2, round(cp_frac * size * size))
+                for i in range(PUZZLES_PER_BUCKET):
+                    parse_result, _ = generate_puzzle(size, size, checkpoints, wall_density, seed,
+                                                      mixing_steps(size, size))
+                    puzzles.append({
+                        "id": f"{bucket}#{i}",
+                        "bucket": bucket,
+                        "seed": seed,
+                        "rows": parse_result.rows,
+                        "cols": parse_result.cols,
+                        "grid": parse_result.grid,
+                        "blocked_edges": sorted(sorted(edge) for edge in parse_result.blocked_edges),
+                    })
+                    seed += 1
+    return {"version": CORPUS_VERSION, "puzzles": puzzles}
+
+
+def load_corpus(path: str = CORPUS_PATH) -> Dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def puzzle_to_parse_result(entry: Dict) -> GridParseResult:
+    grid = entry["grid"]
+    return GridParseResult(
+        grid=grid,
+        numbered_cells={val: (r, c) for r, row in enumerate(grid) for c, val in enumerate(row) if val > 0},
+        rows=entry["rows"],
+        cols=entry["cols"],
+        cell_rects={},
+        blocked_edges={frozenset(tuple(cell) for cell in edge) for edge in entry["blocked_edges"]},
+    )
+
+
+# -------------------------------------------------------
+# RUN
+# -------------------------------------------------------
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    k = (len(ordered) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def capped_solve(solver: ZipSolverCore, node_cap: int):
+    """Solve, stopping once node_cap nodes are expanded; returns (solution, capped)."""
+    cancel = threading.Event()
+
+    def on_progress(nodes: int):
+        if nodes >= node_cap:
+            cancel.set()
+
+    solution = solver.solve_zip_game(on_progress, cancel)
+    return solution, solution is None and cancel.is_set()
+
+
+def run_puzzle(parse_result: GridParseResult, repeat: int, measure_memory: bool,
+               node_cap: int = DEFAULT_NODE_CAP) -> Dict:
+    """Best-of-repeat wall time, nodes and (separately measured) peak memory.
+
+    A solve that hits node_cap is a failure. The search is deterministic, so
+    it is not repeated or memory-profiled.
+    """
+    best = None
+    solver: Optional[ZipSolverCore] = None
+    solution = None
+    capped = False
+    for _ in range(repeat):
+        # Timed like production: dispatch + solver setup + search
+        start = time.perf_counter()
+        solver = build_solver(parse_result)
+        solution, capped = capped_solve(solver, node_cap)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        if capped:
+            break
+
+    if capped:
+        valid, message = False, f"Node cap ({node_cap}) reached"
+    elif solution:
+        valid, message = solver.validate_solution(solution)
+    else:
+        valid, message = False, "No solution found"
+
+    peak_kb = None
+    if measure_memory and not capped:
+        # Separate pass: tracemalloc slows the solver down too much to time it
+        tracemalloc.start()
+        build_solver(parse_result).solve_zip_game()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_kb = peak / 1024
+
+    return {
+        "config": config_to_dict(select_config(parse_result)),
+        "time_s": best,
+        "nodes": solver.nodes_expanded,
+        "solved": bool(solution),
+        "valid": valid,
+        "capped": capped,
+        "message": message,
+        "peak_kb": peak_kb,
+    }
+
+
+def summarize(records: List[Dict]) -> Dict[str, Dict]:
+    """Per-bucket percentiles, node counts, throughput and peak memory.
+
+    Capped solves count in the percentiles with the time and nodes they
+    used up to the cap.
+    """
+    buckets: Dict[str, List[Dict]] = {}
+    for rec in records:
+        buckets.setdefault(rec["bucket"], []).append(rec)
+
+    summary = {}
+    for bucket, recs in sorted(buckets.items()):
+        times = [rec["time_s"] for rec in recs]
+        nodes = [rec["nodes"] for rec in recs]
+        total_time = sum(times)
+        peaks = [rec["peak_kb"] for rec in recs if rec["peak_kb"] is not None]
+        summary[bucket] = {
+            "count": len(recs),
+            "capped": sum(1 for rec in recs if rec["capped"]),
+            "invalid": sum(1 for rec in recs if not rec["valid"] and not rec["capped"]),
+            "time_p50_ms": percentile(times, 50) * 1000,
+            "time_p90_ms": percentile(times, 90) * 1000,
+            "time_p99_ms": percentile(times, 99) * 1000,
+            "time_max_ms": max(times) * 1000,
+            "nodes_mean": statistics.mean(nodes),
+            "nodes_max": max(nodes),
+            "nodes_per_sec": sum(nodes) / total_time if total_time > 0 else 0.0,
+            "peak_kb_max": max(peaks) if peaks else None,
+        }
+    return summary
+
+
+def run_benchmark(corpus: Dict, repeat: int = 3, measure_memory: bool = True,
+                  verbose: bool = False, node_cap: int = DEFAULT_NODE_CAP) -> Dict:
+    """Time each puzzle once per pass over the corpus, keeping its best time.
+
+    Repeats are spread over passes rather than run back to back, so a burst
+    of machine noise slows one sample of a puzzle instead of all of them.
+    """
+    records: Dict[str, Dict] = {}
+    for _ in range(repeat):
+        for entry in corpus["puzzles"]:
+            prev = records.get(entry["id"])
+            if prev is not None and prev["capped"]:
+                continue  # deterministic: a capped solve caps again
+            parse_result = puzzle_to_parse_result(entry)
+            rec = run_puzzle(parse_result, 1, measure_memory and prev is None, node_cap)
+            if prev is not None:
+                prev["time_s"] = min(prev["time_s"], rec["time_s"])
+                continue
+            rec.update({"id": entry["id"], "bucket": entry["bucket"],
+                        "features": puzzle_features(parse_result)})
+            records[entry["id"]] = rec
+
+    if verbose:
+        for rec in records.values():
+            print(f"{rec['id']:<24} {rec['time_s'] * 1000:9.2f} ms {rec['nodes']:>9} nodes "
+                  f"{'ok' if rec['valid'] else rec['message']}")
+    records = list(records.values())
+
+    return {
+        "corpus_version": corpus["version"],
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "node_cap": node_cap,
+        "summary": summarize(records),
+        "records": records,
+    }
+
+
+def sweep_configs(corpus: Dict, node_cap: int, verbose: bool = False) -> List[Dict]:
+    """Time every solver config on every puzzle; records feed fit_selection_table.
+
+    Runs that reach node_cap are stopped and recorded as unsolved.
+    """
+    configs = [SolverConfig(engine, ordering, pruning)
+               for engine in ENGINES for ordering in ORDERINGS for pruning in PRUNING_SETS]
+    records = []
+    for entry in corpus["puzzles"]:
+        parse_result = puzzle_to_parse_result(entry)
+        features = puzzle_features(parse_result)
+        for config in configs:
+            solver = ZipSolverCore(parse_result.grid, parse_result.blocked_edges,
+                                   engine=config.engine, ordering=config.ordering,
+                                   pruning=config.pruning)
+            start = time.perf_counter()
+            solution, _ = capped_solve(solver, node_cap)
+            elapsed = time.perf_counter() - start
+            records.append({"id": entry["id"], "bucket": entry["bucket"], "features": features,
+                            "config": config_to_dict(config), "time_s": elapsed,
+                            "nodes": solver.nodes_expanded, "solved": bool(solution)})
+        if verbose:
+            print(f"swept {entry['id']}")
+    return records
+
+
+# -------------------------------------------------------
+# REGRESSION GATE
+# -------------------------------------------------------
+def compare_to_baseline(results: Dict, baseline: Dict, max_time_regression: float,
+                        max_nodes_regression: float, min_time_delta_ms: float,
+                        max_new_capped: int = 0) -> List[str]:
+    """Return a list of regression messages (empty means pass)."""
+    problems = []
+    if baseline.get("corpus_version") != results["corpus_version"]:
+        return [f"Baseline is for corpus v{baseline.get('corpus_version')}, "
+                f"results for v{results['corpus_version']}; run --update-baseline"]
+    if baseline.get("node_cap") != results["node_cap"]:
+        return [f"Baseline used node cap {baseline.get('node_cap')}, results "
+                f"{results['node_cap']}; pass --node-cap or run --update-baseline"]
+
+    for bucket, cur in results["summary"].items():
+        if cur["invalid"]:
+            problems.append(f"{bucket}: {cur['invalid']} invalid/missing solutions")
+        base = baseline["summary"].get(bucket)
+        if base is None:
+            if cur["capped"]:
+                problems.append(f"{bucket}: {cur['capped']} capped solves (no baseline)")
+            continue
+        if cur["capped"] > base["capped"] + max_new_capped:
+            problems.append(f"{bucket}: {cur['capped']} capped solves > {base['capped']} in baseline")
+        for key in ("time_p50_ms", "time_p90_ms"):
+            limit = base[key] * (1 + max_time_regression)
+            if cur[key] > limit and cur[key] - base[key] > min_time_delta_ms:
+                problems.append(f"{bucket}: {key} {cur[key]:.2f} > {base[key]:.2f} "
+                                f"(+{max_time_regression:.0%} allowed)")
+        limit = base["nodes_mean"] * (1 + max_nodes_regression)
+        if cur["nodes_mean"] > limit:
+            problems.append(f"{bucket}: nodes_mean {cur['nodes_mean']:.0f} > {base['nodes_mean']:.0f} "
+                            f"(+{max_nodes_regression:.0%} allowed)")
+    return problems
+
+
+def print_summary(summary: Dict[str, Dict]):
+    print(f"{'bucket':<20} {'n':>3} {'cap':>3} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} "
+          f"{'nodes':>9} {'nodes/s':>10} {'peak KB':>8}")
+    for bucket, s in summary.items():
+        peak = f"{s['peak_kb_max']:.0f}" if s["peak_kb_max"] is not None else "-"
+        print(f"{bucket:<20} {s['count']:>3} {s['capped']:>3} {s['time_p50_ms']:>9.2f} "
+              f"{s['time_p90_ms']:>9.2f} {s['time_p99_ms']:>9.2f} {s['nodes_mean']:>9.0f} "
+              f"{s['nodes_per_sec']:>10.0f} {peak:>8}")
+
+
+def write_json(path: str, data: Dict):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+
+
+def write_corpus(path: str, corpus: Dict):
+    """Compact JSON, one puzzle per line, so corpus diffs stay reviewable."""
+    lines = [json.dumps(puzzle, separators=(",", ":")) for puzzle in corpus["puzzles"]]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f'{{"version":{corpus["version"]},"puzzles":[\n')
+        f.write(",\n".join(lines))
+        f.write("\n]}\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Zip solver benchmark suite")
+    parser.add_argument("--corpus", default=CORPUS_PATH)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--output", default=RESULTS_PATH, help="Machine-readable results file")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per puzzle (best is kept)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--max-time-regression", type=float, default=0.5,
+                        help="Allowed relative increase of p50/p90 time per bucket")
+    parser.add_argument("--max-nodes-regression", type=float, default=0.1,
+                        help="Allowed relative increase of mean nodes per bucket")
+    parser.add_argument("--min-time-delta-ms", type=float, default=2.0,
+                        help="Ignore time regressions smaller than this (timer noise)")
+    parser.add_argument("--node-cap", type=int, default=DEFAULT_NODE_CAP,
+                        help="Per-solve node budget; a capped solve counts as a failure")
+    parser.add_argument("--max-new-capped", type=int, default=0,
+                        help="Allowed capped solves per bucket beyond the baseline's")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--build-corpus", action="store_true")
+    parser.add_argument("--fit-table", action="store_true",
+                        help="Sweep all solver configs and write the dispatcher's selection table")
+    parser.add_argument("--sweep-node-cap", type=int, default=20 * PROGRESS_INTERVAL,
+                        help="Per-run node budget during --fit-table")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    if args.build_corpus:
+        os.makedirs(os.path.dirname(args.corpus), exist_ok=True)
+        corpus = build_corpus()
+        write_corpus(args.corpus, corpus)
+        print(f"Wrote {len(corpus['puzzles'])} puzzles to {args.corpus}")
+        return 0
+
+    corpus = load_corpus(args.corpus)
+
+    if args.fit_table:
+        records = sweep_configs(corpus, args.sweep_node_cap, args.verbose)
+        write_json(args.output, {"corpus_version": corpus["version"], "records": records})
+        table = fit_selection_table(records)
+        save_selection_table(table, TABLE_PATH)
+        for bucket, config in sorted(table.items()):
+            print(f"{bucket:<24} {config_to_dict(config)}")
+        print(f"\nSelection table written to {TABLE_PATH}")
+        return 0
+
+    results = run_benchmark(corpus, args.repeat, not args.no_memory, args.verbose, args.node_cap)
+    write_json(args.output, results)
+    print_summary(results["summary"])
+    print(f"\nResults written to {args.output}")
+
+    if args.update_baseline:
+        # Baseline keeps the summary only; per-puzzle records live in the results file
+        write_json(args.baseline, {key: val for key, val in results.items() if key != "records"})
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("⚠️ No baseline found; run with --update-baseline")
+        failed = sum(s["invalid"] + s["capped"] for s in results["summary"].values())
+        return 1 if failed else 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    problems = compare_to_baseline(results, baseline, args.max_time_regression,
+                                   args.max_nodes_regression, args.min_time_delta_ms,
+                                   args.max_new_capped)
+    if problems:
+        print("\n❌ Regressions:")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+    print("\n✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
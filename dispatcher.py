@@ -0,0 +1,199 @@
+"""Adaptive solver configuration from cheap puzzle features."""
+
+import json
+import os
+from typing import Dict, Iterable, Optional, Tuple
+
+from models import GridParseResult, SolverConfig
+from solver import ZipSolverCore
+
+# Fallback when a bucket is missing from the table
+DEFAULT_CONFIG = SolverConfig(engine="stack", ordering="fixed", pruning=("dead_end",))
+
+# Valid selection-table keys: size|walls|checkpoints (see feature_bucket)
+BUCKETS = tuple(
+    f"{size}|{walls}|{checkpoints}"
+    for size in ("small", "medium", "large")
+    for walls in ("open", "walled")
+    for checkpoints in ("sparse", "dense")
+)
+
+# bucket -> config, measured on random solvable grids from 5x5 (small) to
+# 8x8 (medium). large (> 64 free cells) was not measured and falls back to
+# DEFAULT_CONFIG until a fitted table covers it.
+# Re-fit with fit_selection_table() from benchmark records.
+DEFAULT_TABLE: Dict[str, SolverConfig] = {
+    "small|open|sparse": SolverConfig("stack", "fixed", ("dead_end",)),
+    "small|open|dense": SolverConfig("stack", "target", ("dead_end",)),
+    "small|walled|sparse": SolverConfig("stack", "fixed", ("dead_end",)),
+    "small|walled|dense": SolverConfig("stack", "target", ("dead_end",)),
+    "medium|open|sparse": SolverConfig("stack", "target", ("dead_end", "connectivity")),
+    "medium|open|dense": SolverConfig("stack", "target", ("dead_end", "connectivity")),
+    "medium|walled|sparse": SolverConfig("stack", "fixed", ("dead_end",)),
+    "medium|walled|dense": SolverConfig("stack", "warnsdorff", ("dead_end",)),
+}
+
+# Optional re-fitted table, picked up automatically if present
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "selection_table.json")
+
+_table_cache: Optional[Dict[str, SolverConfig]] = None
+
+
+def bucket_features(parse_result: GridParseResult,
+                    solver: Optional[ZipSolverCore] = None) -> Dict[str, float]:
+    """Features feature_bucket reads; cheap enough for every solve.
+
+    free_cells is the number of cells reachable from #1, taken from the
+    solver's (cached) feasibility check.
+    """
+    if solver is None:
+        solver = ZipSolverCore(parse_result.grid, parse_result.blocked_edges)
+    solver.check_feasibility()
+    rows, cols = parse_result.rows, parse_result.cols
+    free_cells = len(solver.reachable_cells) if solver.reachable_cells else 0
+    interior_edges = rows * (cols - 1) + (rows - 1) * cols
+    return {
+        "free_cells": free_cells,
+        "wall_density": len(parse_result.blocked_edges) / interior_edges if interior_edges else 0.0,
+        "checkpoint_density": len(solver.numbered_cells) / free_cells if free_cells else 0.0,
+    }
+
+
+def puzzle_features(parse_result: GridParseResult,
+                    solver: Optional[ZipSolverCore] = None) -> Dict[str, float]:
+    """bucket_features plus descriptive ones (degree distribution, symmetry).
+
+    The extra features are recorded with benchmark results for analysis and
+    future bucketing; they are not computed on the solve path.
+    """
+    if solver is None:
+        solver = ZipSolverCore(parse_result.grid, parse_result.blocked_edges)
+    features = bucket_features(parse_result, solver)
+    rows, cols = parse_result.rows, parse_result.cols
+    blocked = parse_result.blocked_edges
+    free_cells = features["free_cells"]
+
+    degrees = [0, 0, 0, 0, 0]
+    for cell in solver.reachable_cells or ():
+        degrees[len(solver._neighbors(*cell))] += 1
+
+    # Share of walls whose left-right mirror is also a wall
+    mirrored = 0
+    for edge in blocked:
+        mirror = frozenset((r, cols - 1 - c) for r, c in edge)
+        if mirror in blocked:
+            mirrored += 1
+
+    features.update({
+        "rows": rows,
+        "cols": cols,
+        "walls": len(blocked),
+        "checkpoints": len(solver.numbered_cells),
+        "deg1_frac": degrees[1] / free_cells if free_cells else 0.0,
+        "deg2_frac": degrees[2] / free_cells if free_cells else 0.0,
+        "deg3_frac": degrees[3] / free_cells if free_cells else 0.0,
+        "deg4_frac": degrees[4] / free_cells if free_cells else 0.0,
+        "symmetry": mirrored / len(blocked) if blocked else 1.0,
+    })
+    return features
+
+
+def feature_bucket(features: Dict[str, float]) -> str:
+    """Map features to a selection-table key: size|walls|checkpoints."""
+    if features["free_cells"] <= 36:
+        size = "small"
+    elif features["free_cells"] <= 64:
+        size = "medium"
+    else:
+        size = "large"
+    walls = "walled" if features["wall_density"] >= 0.1 else "open"
+    checkpoints = "dense" if features["checkpoint_density"] >= 0.2 else "sparse"
+    return f"{size}|{walls}|{checkpoints}"
+
+
+def config_to_dict(config: SolverConfig) -> Dict:
+    return {"engine": config.engine, "ordering": config.ordering, "pruning": list(config.pruning)}
+
+
+def config_from_dict(data: Dict) -> SolverConfig:
+    defaults = SolverConfig()
+    return SolverConfig(
+        engine=data.get("engine", defaults.engine),
+        ordering=data.get("ordering", defaults.ordering),
+        pruning=tuple(data.get("pruning", defaults.pruning)),
+    )
+
+
+def load_selection_table(path: str = TABLE_PATH) -> Dict[str, SolverConfig]:
+    """Load a fitted table, falling back to DEFAULT_TABLE."""
+    if not os.path.exists(path):
+        return dict(DEFAULT_TABLE)
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    table = dict(DEFAULT_TABLE)
+    table.update({bucket: config_from_dict(cfg) for bucket, cfg in data.items()})
+    return table
+
+
+def save_selection_table(table: Dict[str, SolverConfig], path: str = TABLE_PATH) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({bucket: config_to_dict(cfg) for bucket, cfg in sorted(table.items())}, f, indent=2)
+
+
+def fit_selection_table(records: Iterable[Dict]) -> Dict[str, SolverConfig]:
+    """Pick the fastest config per bucket from benchmark records.
+
+    Each record is {"features": {...} or "bucket": str, "config": {...},
+    "time_s": float, "solved": bool}. Features take precedence; a "bucket"
+    that is not one of BUCKETS is ignored. Configs are ranked by failures
+    (unsolved runs), then median time, then p90 time, so every bucket with
+    records gets an entry even if no config solves all of its puzzles.
+    """
+    import statistics  # only needed when re-fitting
+
+    times: Dict[str, Dict[SolverConfig, list]] = {}
+    failures: Dict[Tuple[str, SolverConfig], int] = {}
+    for rec in records:
+        bucket = feature_bucket(rec["features"]) if "features" in rec else rec["bucket"]
+        if bucket not in BUCKETS:
+            continue  # e.g. a benchmark label like "5x5|open|few"; select_config never looks it up
+        config = config_from_dict(rec["config"])
+        if not rec.get("solved", True):
+            failures[bucket, config] = failures.get((bucket, config), 0) + 1
+        times.setdefault(bucket, {}).setdefault(config, []).append(rec["time_s"])
+
+    table = {}
+    for bucket, per_config in times.items():
+        ranked = []
+        for config, samples in per_config.items():
+            samples = sorted(samples)
+            p90 = samples[min(len(samples) - 1, int(0.9 * len(samples)))]
+            ranked.append((failures.get((bucket, config), 0), statistics.median(samples), p90, config))
+        ranked.sort(key=lambda item: item[:3])
+        table[bucket] = ranked[0][3]
+    return table
+
+
+def select_config(parse_result: GridParseResult,
+                  table: Optional[Dict[str, SolverConfig]] = None,
+                  solver: Optional[ZipSolverCore] = None) -> SolverConfig:
+    """Config predicted to be fastest for this puzzle."""
+    global _table_cache
+    if table is None:
+        if _table_cache is None:
+            _table_cache = load_selection_table()
+        table = _table_cache
+    return table.get(feature_bucket(bucket_features(parse_result, solver)), DEFAULT_CONFIG)
+
+
+def build_solver(parse_result: GridParseResult,
+                 table: Optional[Dict[str, SolverConfig]] = None) -> ZipSolverCore:
+    """ZipSolverCore configured by select_config.
+
+    The feasibility check run for the features is cached on the solver, so
+    solving afterwards does not repeat it.
+    """
+    solver = ZipSolverCore(parse_result.grid, parse_result.blocked_edges)
+    config = select_config(parse_result, table, solver)
+    solver.configure(config.engine, config.ordering, config.pruning)
+    return solver
@@ -8,7 +8,6 @@ from selenium.common.exceptions import TimeoutException
 import math
 
 from models import GridParseResult
-from solver import ZipSolverCore  # For reachability check
 
 def extract_zip_grid_improved(driver: webdriver.Chrome) -> GridParseResult:
     """Minimal grid extraction."""
@@ -122,9 +121,10 @@ def extract_zip_grid_improved(driver: webdriver.Chrome) -> GridParseResult:
         
         print(f"\nTotal blocked edges: {len(blocked_edges)}")
         
-        # Check reachability
-        temp_solver = ZipSolverCore(grid, blocked_edges)
+        # Check reachability (debug only)
         if 1 in numbered_cells:
+            from solver import ZipSolverCore
+            temp_solver = ZipSolverCore(grid, blocked_edges)
             start = numbered_cells[1]
             reachable = temp_solver.get_reachable_cells(start)
             print(f"\n=== Reachability Check ===")
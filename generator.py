@@ -0,0 +1,167 @@
+"""Random solvable puzzle generator for stress testing."""
+
+import argparse
+import random
+import time
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from models import GridParseResult
+
+Cell = Tuple[int, int]
+
+# Default backbite moves per cell: cheap enough for bulk stress batches, but
+# not well mixed on large boards (see mixing_steps)
+FAST_STEPS_PER_CELL = 4
+
+
+def _serpentine_path(rows: int, cols: int) -> List[Cell]:
+    """Boustrophedon Hamiltonian path, the starting point for backbite moves."""
+    return [(r, c if r % 2 == 0 else cols - 1 - c) for r in range(rows) for c in range(cols)]
+
+
+@lru_cache(maxsize=32)
+def _grid_neighbors(rows: int, cols: int) -> Dict[Cell, Tuple[Cell, ...]]:
+    return {
+        (r, c): tuple((nr, nc) for nr, nc in ((r, c + 1), (r + 1, c), (r, c - 1), (r - 1, c))
+                      if 0 <= nr < rows and 0 <= nc < cols)
+        for r in range(rows) for c in range(cols)
+    }
+
+
+@lru_cache(maxsize=32)
+def _grid_edges(rows: int, cols: int) -> Tuple[FrozenSet[Cell], ...]:
+    return tuple(
+        frozenset({(r, c), (r + dr, c + dc)})
+        for r in range(rows) for c in range(cols)
+        for dr, dc in ((0, 1), (1, 0))
+        if r + dr < rows and c + dc < cols
+    )
+
+
+def mixing_steps(rows: int, cols: int) -> int:
+    """Backbite moves for a well-mixed path: max(10, 2 * longest side) per cell."""
+    return max(10, 2 * max(rows, cols)) * rows * cols
+
+
+def random_hamiltonian_path(rows: int, cols: int, rng: random.Random,
+                            steps: Optional[int] = None) -> List[Cell]:
+    """Random Hamiltonian path on an open rows x cols grid via backbite moves.
+
+    Each move picks an endpoint and a grid neighbor x of it; the edge to x is
+    added and the path edge leaving x towards that endpoint is dropped, which
+    reverses the segment between them. steps defaults to FAST_STEPS_PER_CELL
+    moves per cell; pass mixing_steps(rows, cols) for a well-mixed path.
+    """
+    path = _serpentine_path(rows, cols)
+    n = len(path)
+    if n < 3:
+        return path
+    index = {cell: i for i, cell in enumerate(path)}
+    neighbors = _grid_neighbors(rows, cols)
+    if steps is None:
+        steps = FAST_STEPS_PER_CELL * n
+
+    rand = rng.random
+    for _ in range(steps):
+        # Backbite from a random end; one draw picks the end and the neighbor
+        x = 2 * rand()
+        from_tail = x >= 1
+        end = path[-1] if from_tail else path[0]
+        options = neighbors[end]
+        i = index[options[int((x % 1) * len(options))]]
+        if from_tail:
+            if i == n - 2:
+                continue  # already the path neighbor
+            lo, hi = i + 1, n
+        else:
+            if i == 1:
+                continue
+            lo, hi = 0, i
+        segment = path[lo:hi]
+        segment.reverse()
+        path[lo:hi] = segment
+        index.update(zip(segment, range(lo, hi)))
+
+    return path
+
+
+def generate_puzzle(rows: int, cols: int, checkpoints: int = 6, wall_density: float = 0.0,
+                    seed: Optional[int] = None,
+                    steps: Optional[int] = None) -> Tuple[GridParseResult, List[Cell]]:
+    """Solvable puzzle plus its known solution path.
+
+    checkpoints counts all numbers including 1 and the last one (min 2,
+    except on a 1x1 board).
+    wall_density is the target fraction of interior edges that are walled;
+    only edges off the solution path are used, so it is capped accordingly.
+    """
+    rng = random.Random(seed)
+    path = random_hamiltonian_path(rows, cols, rng, steps)
+    n = len(path)
+
+    # Checkpoints: 1 at the start, max at the end, the rest in path order
+    if n > 1:
+        count = max(2, min(checkpoints, n))
+        positions = [0] + sorted(rng.sample(range(1, n - 1), count - 2)) + [n - 1]
+    else:
+        positions = [0]  # 1x1: the start is the whole path
+    grid = [[0] * cols for _ in range(rows)]
+    numbered_cells = {}
+    for num, pos in enumerate(positions, start=1):
+        r, c = path[pos]
+        grid[r][c] = num
+        numbered_cells[num] = (r, c)
+
+    # Walls on edges the solution never crosses
+    blocked_edges = set()
+    if wall_density > 0:
+        path_edges = set(map(frozenset, zip(path, path[1:])))
+        all_edges = _grid_edges(rows, cols)
+        free_edges = [edge for edge in all_edges if edge not in path_edges]
+        wall_count = min(len(free_edges), round(wall_density * len(all_edges)))
+        blocked_edges = set(rng.sample(free_edges, wall_count))
+
+    parse_result = GridParseResult(
+        grid=grid,
+        numbered_cells=numbered_cells,
+        rows=rows,
+        cols=cols,
+        cell_rects={},
+        blocked_edges=blocked_edges
+    )
+    return parse_result, path
+
+
+def generate_batch(count: int, rows: int, cols: int, checkpoints: int = 6,
+                   wall_density: float = 0.0, seed: int = 0,
+                   steps: Optional[int] = None) -> Iterator[Tuple[GridParseResult, List[Cell]]]:
+    """count puzzles; puzzle i uses seed + i, so any one can be regenerated alone."""
+    for i in range(count):
+        yield generate_puzzle(rows, cols, checkpoints, wall_density, seed + i, steps)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate random solvable Zip puzzles")
+    parser.add_argument("--rows", type=int, default=7)
+    parser.add_argument("--cols", type=int, default=7)
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--checkpoints", type=int, default=6)
+    parser.add_argument("--walls", type=float, default=0.1, help="Target wall density")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mixed", action="store_true",
+                        help="Well-mixed paths (mixing_steps) instead of the fast default")
+    args = parser.parse_args()
+    steps = mixing_steps(args.rows, args.cols) if args.mixed else None
+
+    start = time.perf_counter()
+    for _ in generate_batch(args.count, args.rows, args.cols, args.checkpoints, args.walls,
+                            args.seed, steps):
+        pass
+    elapsed = time.perf_counter() - start
+    print(f"Generated {args.count} {args.rows}x{args.cols} puzzles in {elapsed:.2f}s "
+          f"({args.count / elapsed:.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
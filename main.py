@@ -4,18 +4,100 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import queue
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from worker import worker_extract_and_solve, result_queue, create_mock_puzzle
+from worker import worker_extract_and_solve, solve_parse_result, create_mock_puzzle
 from visualizer import ZipGameVisualizer
-from solver import ZipSolverCore
+
+class SolveWindow:
+    """Small Toplevel tracking one background solve.
+
+    The job runs on the app's executor; progress and the final result are
+    posted to this window's own queue and picked up on the Tk thread via a
+    virtual event, so several solves can run side by side.
+    """
+
+    PROGRESS_MIN_INTERVAL = 0.1  # seconds between progress repaints
+
+    def __init__(self, app, title: str, job, on_result):
+        self.app = app
+        self.on_result = on_result
+        self.events = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.started = time.perf_counter()
+        self._last_progress = 0.0
+
+        self.top = tk.Toplevel(app.root)
+        self.top.title(title)
+        self.top.geometry("320x150")
+        self.top.protocol("WM_DELETE_WINDOW", self.cancel)
+
+        frame = ttk.Frame(self.top, padding=12)
+        frame.pack(fill=tk.BOTH, expand=True)
+        self.status_label = ttk.Label(frame, text="🔄 Solving...", font=("Arial", 10, "bold"))
+        self.status_label.pack(pady=4)
+        self.nodes_label = ttk.Label(frame, text="Nodes: 0", font=("Arial", 9))
+        self.nodes_label.pack(pady=2)
+        self.progress = ttk.Progressbar(frame, mode='indeterminate')
+        self.progress.pack(fill=tk.X, pady=4)
+        self.progress.start()
+        ttk.Button(frame, text="Cancel", command=self.cancel).pack(pady=4)
+
+        self.top.bind("<<SolveEvent>>", self.drain_events)
+        future = app.executor.submit(job, self.post_progress, self.cancel_event)
+        future.add_done_callback(self.on_done)
+
+    # --- Called from the worker thread ---
+    def post(self, event):
+        self.events.put(event)
+        try:
+            self.top.event_generate("<<SolveEvent>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            pass  # Window or main loop already gone
+
+    def post_progress(self, nodes: int):
+        now = time.perf_counter()
+        if now - self._last_progress >= self.PROGRESS_MIN_INTERVAL:
+            self._last_progress = now
+            self.post(("PROGRESS", nodes))
+
+    def on_done(self, future):
+        try:
+            result = future.result()
+        except Exception as e:
+            result = ("ERROR", None, None, f"Error: {e}")
+        self.post(("RESULT", result))
+
+    # --- Tk thread ---
+    def drain_events(self, event=None):
+        while True:
+            try:
+                kind, payload = self.events.get_nowait()
+            except queue.Empty:
+                return
+            if kind == "PROGRESS":
+                elapsed = time.perf_counter() - self.started
+                rate = payload / elapsed if elapsed > 0 else 0
+                self.nodes_label.config(text=f"Nodes: {payload:,} ({rate:,.0f}/s)")
+            else:
+                self.progress.stop()
+                self.top.destroy()
+                self.on_result(payload)
+                return
+
+    def cancel(self):
+        self.cancel_event.set()
+        self.status_label.config(text="⏹ Cancelling...")
 
 class ZipSolverApp:
     def __init__(self, root):
         self.root = root
         root.title("Zip Game Solver")
         root.geometry("500x400")
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="solve")
+        self.active_jobs = set()
         self.build_ui()
-        self.root.after(200, self.poll_result_queue)
 
     def build_ui(self):
         main = ttk.Frame(self.root, padding=20)
@@ -54,92 +136,90 @@ class ZipSolverApp:
         
         ttk.Label(main, text=instructions, justify=tk.LEFT, font=("Arial", 9)).pack(pady=10)
 
+    def start_job(self, title: str, job, status: str):
+        """Run job(progress_callback, cancel_event) on the executor in its own window."""
+        window = None
+
+        def on_result(result):
+            self.active_jobs.discard(window)
+            self.update_running_status()
+            self.show_result(result)
+
+        window = SolveWindow(self, title, job, on_result)
+        self.active_jobs.add(window)
+        self.status_label.config(text=status, foreground="")
+        self.update_running_status()
+
+    def update_running_status(self):
+        if self.active_jobs:
+            self.progress.pack(fill=tk.X, pady=5)
+            self.progress.start()
+        else:
+            self.progress.stop()
+            self.progress.pack_forget()
+
     def solve_live(self):
         """Solve the current puzzle on LinkedIn."""
-        self.solve_btn.config(state=tk.DISABLED)
-        self.status_label.config(text="🔄 Starting browser and extracting puzzle...")
-        self.progress.pack(fill=tk.X, pady=5)
-        self.progress.start()
-        
-        threading.Thread(target=worker_extract_and_solve, daemon=True).start()
+        self.start_job("Live Puzzle", worker_extract_and_solve,
+                       "🔄 Starting browser and extracting puzzle...")
 
     def test_solver(self):
         """Test the solver with the 5x5 mock puzzle."""
-        try:
-            self.status_label.config(text="🧪 Testing 5x5 mock puzzle...")
-            
-            test_parse = create_mock_puzzle()
-            solver = ZipSolverCore(test_parse.grid, test_parse.blocked_edges)
-            solution = solver.solve_zip_game()
+        test_parse = create_mock_puzzle()
+        self.start_job("Test 5x5 Puzzle",
+                       lambda progress, cancel: solve_parse_result(test_parse, progress, cancel),
+                       "🧪 Testing 5x5 mock puzzle...")
+
+    def show_result(self, result):
+        """Report a finished solve and open the visualizer."""
+        result_type, parse_result, solution, message = result
+
+        if result_type == "SUCCESS":
+            self.status_label.config(text="✅ Puzzle solved successfully!", foreground="green")
+            ZipGameVisualizer(self.root, parse_result, solution)
+            messagebox.showinfo("Success", 
+                              f"Solution found!\n\n"
+                              f"Grid: {parse_result.rows}x{parse_result.cols}\n"
+                              f"Path length: {len(solution)} steps\n"
+                              f"Numbers: {sorted(parse_result.numbered_cells.keys())}\n"
+                              f"Walls: {len(parse_result.blocked_edges)}\n\n"
+                              f"{message}")
             
+        elif result_type == "INVALID":
+            self.status_label.config(text="⚠️ Solution has issues", foreground="orange")
             if solution:
-                is_valid, message = solver.validate_solution(solution)
-                if is_valid:
-                    self.status_label.config(text="✅ 5x5 puzzle solved!", foreground="green")
-                    ZipGameVisualizer(self.root, test_parse, solution)
-                    messagebox.showinfo("Test Success", 
-                                      f"✅ 5x5 puzzle solved successfully!\n\n"
-                                      f"Path length: {len(solution)} steps\n"
-                                      f"Numbers: {sorted(test_parse.numbered_cells.keys())}\n"
-                                      f"Walls: {len(test_parse.blocked_edges)}")
-                else:
-                    self.status_label.config(text="❌ Solution invalid", foreground="red")
-                    messagebox.showerror("Test Failed", f"Solution invalid: {message}")
+                ZipGameVisualizer(self.root, parse_result, solution)
+            messagebox.showwarning("Validation", message)
+            
+        elif result_type == "NO_SOLUTION":
+            self.status_label.config(text="❌ No solution found", foreground="red")
+            if parse_result:
+                messagebox.showerror("No Solution", 
+                                   f"No solution found for this puzzle.\n\n"
+                                   f"Grid: {parse_result.rows}x{parse_result.cols}\n"
+                                   f"Numbers: {sorted(parse_result.numbered_cells.keys())}\n"
+                                   f"Walls: {len(parse_result.blocked_edges)}\n\n"
+                                   f"{message}")
             else:
-                self.status_label.config(text="❌ No solution found", foreground="red")
-                messagebox.showerror("Test Failed", "No solution found for 5x5 puzzle")
-                
-        except Exception as e:
-            self.status_label.config(text="❌ Test error", foreground="red")
-            messagebox.showerror("Test Error", f"Test failed: {e}")
+                messagebox.showerror("No Solution", "No solution found.")
 
-    def poll_result_queue(self):
-        """Check for results from the worker thread."""
-        try:
-            while True:
-                result_type, parse_result, solution, message = result_queue.get_nowait()
-                
-                self.solve_btn.config(state=tk.NORMAL)
-                self.progress.stop()
-                self.progress.pack_forget()
-                
-                if result_type == "SUCCESS":
-                    self.status_label.config(text="✅ Puzzle solved successfully!", foreground="green")
-                    ZipGameVisualizer(self.root, parse_result, solution)
-                    messagebox.showinfo("Success", 
-                                      f"Solution found!\n\n"
-                                      f"Grid: {parse_result.rows}x{parse_result.cols}\n"
-                                      f"Numbers: {sorted(parse_result.numbered_cells.keys())}\n"
-                                      f"Walls: {len(parse_result.blocked_edges)}\n\n"
-                                      f"{message}")
-                    
-                elif result_type == "INVALID":
-                    self.status_label.config(text="⚠️ Solution has issues", foreground="orange")
-                    if solution:
-                        ZipGameVisualizer(self.root, parse_result, solution)
-                    messagebox.showwarning("Validation", message)
-                    
-                elif result_type == "NO_SOLUTION":
-                    self.status_label.config(text="❌ No solution found", foreground="red")
-                    if parse_result:
-                        messagebox.showerror("No Solution", 
-                                           f"No solution found for this puzzle.\n\n"
-                                           f"Grid: {parse_result.rows}x{parse_result.cols}\n"
-                                           f"Numbers: {sorted(parse_result.numbered_cells.keys())}\n"
-                                           f"Walls: {len(parse_result.blocked_edges)}")
-                    else:
-                        messagebox.showerror("No Solution", "No solution found.")
-                    
-                elif result_type == "ERROR":
-                    self.status_label.config(text="❌ Error occurred", foreground="red")
-                    messagebox.showerror("Error", f"Failed to extract puzzle:\n\n{message}")
-                    
-        except queue.Empty:
-            pass
-        finally:
-            self.root.after(500, self.poll_result_queue)
+        elif result_type == "CANCELLED":
+            self.status_label.config(text="⏹ Solve cancelled", foreground="orange")
+            
+        elif result_type == "ERROR":
+            self.status_label.config(text="❌ Error occurred", foreground="red")
+            messagebox.showerror("Error", f"Failed to extract puzzle:\n\n{message}")
+
+    def shutdown(self):
+        """Cancel running solves so executor threads can exit."""
+        for window in list(self.active_jobs):
+            window.cancel_event.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
 
 if __name__ == "__main__":
     root = tk.Tk()
     app = ZipSolverApp(root)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        app.shutdown()
@@ -10,4 +10,10 @@ class GridParseResult:
     rows: int
     cols: int
     cell_rects: Dict[int, Tuple[float, float, float, float]]
-    blocked_edges: Set[frozenset]
\ No newline at end of file
+    blocked_edges: Set[frozenset]
+
+@dataclass(frozen=True)
+class SolverConfig:
+    engine: str = "recursive"
+    ordering: str = "fixed"
+    pruning: Tuple[str, ...] = ()
@@ -0,0 +1,397 @@
+"""
+Headless SVG/PNG rendering of Zip Game solutions.
+No Tk dependency; shares geometry and colours with visualizer.py.
+"""
+
+import math
+import struct
+import zlib
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
+
+from models import GridParseResult
+
+# Geometry / colours (also used by ZipGameVisualizer)
+CELL_SIZE = 55
+MARGIN = 40
+BACKGROUND = "#ffffff"
+EMPTY_FILL, EMPTY_OUTLINE = "#f5f5f5", "#bbbbbb"
+NUMBER_FILL, NUMBER_OUTLINE, NUMBER_TEXT = "#e3f2fd", "#2196f3", "#1976d2"
+WALL_COLOR, WALL_WIDTH = "black", 4
+PATH_COLOR, PATH_WIDTH = "#4caf50", 3
+DOT_FILL, DOT_OUTLINE = "#c8e6c9", "#388e3c"
+HEAD_FILL, HEAD_OUTLINE = "#f44336", "#d32f2f"
+
+Cell = Tuple[int, int]
+
+
+def canvas_size(rows: int, cols: int, cell_size: int = CELL_SIZE, margin: int = MARGIN) -> Tuple[int, int]:
+    return cols * cell_size + 2 * margin, rows * cell_size + 2 * margin
+
+
+def cell_box(r: int, c: int, cell_size: int = CELL_SIZE, margin: int = MARGIN) -> Tuple[int, int, int, int]:
+    x1 = margin + c * cell_size
+    y1 = margin + r * cell_size
+    return x1, y1, x1 + cell_size, y1 + cell_size
+
+
+def cell_center(r: int, c: int, cell_size: int = CELL_SIZE, margin: int = MARGIN) -> Tuple[int, int]:
+    return margin + c * cell_size + cell_size // 2, margin + r * cell_size + cell_size // 2
+
+
+def wall_segment(edge: frozenset, cell_size: int = CELL_SIZE,
+                 margin: int = MARGIN) -> Optional[Tuple[int, int, int, int]]:
+    """Line (x1, y1, x2, y2) on the border between the two cells of a blocked edge."""
+    (r1, c1), (r2, c2) = list(edge)
+    if r1 == r2:  # Vertical
+        x = margin + max(c1, c2) * cell_size
+        y = margin + r1 * cell_size
+        return x, y, x, y + cell_size
+    if c1 == c2:  # Horizontal
+        y = margin + max(r1, r2) * cell_size
+        x = margin + c1 * cell_size
+        return x, y, x + cell_size, y
+    return None
+
+
+def _visible_path(path: List[Cell], step: Optional[int]) -> List[Cell]:
+    if not path:
+        return []
+    if step is None:
+        step = len(path) - 1
+    return path[:max(0, min(step, len(path) - 1)) + 1]
+
+
+# -------------------------------------------------------
+# SVG
+# -------------------------------------------------------
+@lru_cache(maxsize=64)
+def _svg_base(rows: int, cols: int) -> str:
+    """Static layer per grid size: header, background and empty cells."""
+    w, h = canvas_size(rows, cols)
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}" viewBox="0 0 {w} {h}">',
+        f'<rect width="{w}" height="{h}" fill="{BACKGROUND}"/>',
+        f'<g fill="{EMPTY_FILL}" stroke="{EMPTY_OUTLINE}" stroke-width="1">',
+    ]
+    for r in range(rows):
+        for c in range(cols):
+            x1, y1, _, _ = cell_box(r, c)
+            parts.append(f'<rect x="{x1}" y="{y1}" width="{CELL_SIZE}" height="{CELL_SIZE}"/>')
+    parts.append('</g>')
+    return "".join(parts)
+
+
+def _svg_puzzle_layers(parse_result: GridParseResult) -> Tuple[str, str]:
+    """(cells + walls, numbers) layers; numbers are drawn last, on top of the path."""
+    cells = [f'<g fill="{NUMBER_FILL}" stroke="{NUMBER_OUTLINE}" stroke-width="2">']
+    numbers = [f'<g font-family="Arial" font-size="14pt" font-weight="bold" fill="{NUMBER_TEXT}" '
+               f'text-anchor="middle" dominant-baseline="central">']
+    for r, row in enumerate(parse_result.grid):
+        for c, val in enumerate(row):
+            if val > 0:
+                x1, y1, _, _ = cell_box(r, c)
+                cx, cy = x1 + CELL_SIZE / 2, y1 + CELL_SIZE / 2
+                cells.append(f'<rect x="{x1}" y="{y1}" width="{CELL_SIZE}" height="{CELL_SIZE}"/>')
+                numbers.append(f'<text x="{cx:g}" y="{cy:g}">{val}</text>')
+    cells.append('</g>')
+    numbers.append('</g>')
+
+    cells.append(f'<g stroke="{WALL_COLOR}" stroke-width="{WALL_WIDTH}">')
+    for edge in parse_result.blocked_edges:
+        seg = wall_segment(edge)
+        if seg:
+            cells.append('<line x1="{}" y1="{}" x2="{}" y2="{}"/>'.format(*seg))
+    cells.append('</g>')
+    return "".join(cells), "".join(numbers)
+
+
+def _svg_dot(cell: Cell, fill: str, outline: str) -> str:
+    cx, cy = cell_center(*cell)
+    radius = CELL_SIZE // 4
+    return (f'<circle cx="{cx}" cy="{cy}" r="{radius}" fill="{fill}" stroke="{outline}" '
+            f'stroke-width="2"/>')
+
+
+def render_svg(parse_result: GridParseResult, path: List[Cell], step: Optional[int] = None) -> str:
+    """SVG of the puzzle with the path drawn up to step (default: full path)."""
+    shown = _visible_path(path, step)
+    cells, numbers = _svg_puzzle_layers(parse_result)
+    parts = [_svg_base(parse_result.rows, parse_result.cols), cells]
+
+    if len(shown) > 1:
+        points = " ".join("{},{}".format(*cell_center(r, c)) for r, c in shown)
+        parts.append(f'<polyline points="{points}" fill="none" stroke="{PATH_COLOR}" '
+                     f'stroke-width="{PATH_WIDTH}"/>')
+    for i, cell in enumerate(shown):
+        if i == len(shown) - 1:
+            parts.append(_svg_dot(cell, HEAD_FILL, HEAD_OUTLINE))
+        else:
+            parts.append(_svg_dot(cell, DOT_FILL, DOT_OUTLINE))
+
+    parts.append(numbers)
+    parts.append('</svg>')
+    return "".join(parts)
+
+
+def render_animated_svg(parse_result: GridParseResult, path: List[Cell], frame_ms: int = 350) -> str:
+    """Single self-animating SVG (SMIL) replaying the path one step per frame_ms."""
+    cells, numbers = _svg_puzzle_layers(parse_result)
+    parts = [_svg_base(parse_result.rows, parse_result.cols), cells]
+
+    def appear(i: int) -> str:
+        return (f'<set attributeName="visibility" to="visible" begin="{i * frame_ms}ms" '
+                f'fill="freeze"/>')
+
+    for i, (a, b) in enumerate(zip(path, path[1:]), start=1):
+        x1, y1 = cell_center(*a)
+        x2, y2 = cell_center(*b)
+        parts.append(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" stroke="{PATH_COLOR}" '
+                     f'stroke-width="{PATH_WIDTH}" visibility="hidden">{appear(i)}</line>')
+    for i, cell in enumerate(path):
+        cx, cy = cell_center(*cell)
+        radius = CELL_SIZE // 4
+        last = i == len(path) - 1
+        # Red while it is the head, green once the path moves on
+        fill = (f'<set attributeName="fill" to="{DOT_FILL}" begin="{(i + 1) * frame_ms}ms" fill="freeze"/>'
+                f'<set attributeName="stroke" to="{DOT_OUTLINE}" begin="{(i + 1) * frame_ms}ms" fill="freeze"/>'
+                if not last else "")
+        parts.append(f'<circle cx="{cx}" cy="{cy}" r="{radius}" fill="{HEAD_FILL}" stroke="{HEAD_OUTLINE}" '
+                     f'stroke-width="2" visibility="hidden">{appear(i)}{fill}</circle>')
+
+    parts.append(numbers)
+    parts.append('</svg>')
+    return "".join(parts)
+
+
+# -------------------------------------------------------
+# PNG (pure stdlib raster)
+# -------------------------------------------------------
+# 3x5 digit glyphs, one string per row
+_DIGITS = {
+    "0": ("111", "101", "101", "101", "111"),
+    "1": ("010", "110", "010", "010", "111"),
+    "2": ("111", "001", "111", "100", "111"),
+    "3": ("111", "001", "111", "001", "111"),
+    "4": ("101", "101", "111", "001", "001"),
+    "5": ("111", "100", "111", "001", "111"),
+    "6": ("111", "100", "111", "101", "111"),
+    "7": ("111", "001", "010", "010", "010"),
+    "8": ("111", "101", "111", "101", "111"),
+    "9": ("111", "101", "111", "001", "111"),
+}
+_GLYPH_SCALE = 3
+
+
+def _rgb(color: str) -> bytes:
+    if color == "black":
+        return b"\x00\x00\x00"
+    return bytes.fromhex(color.lstrip("#"))
+
+
+# Pixel rows (dy, dx, run) relative to the sprite origin
+_Sprite = Tuple[Tuple[int, int, bytes], ...]
+
+
+@lru_cache(maxsize=16)
+def _circle_sprite(radius: int, width: int, fill: bytes, outline: bytes) -> _Sprite:
+    """Filled, outlined circle rasterized once per size and colour."""
+    inner = radius - width
+    rows = []
+    for dy in range(-radius, radius + 1):
+        half = math.isqrt(radius * radius - dy * dy)
+        run = bytearray(outline * (2 * half + 1))
+        if abs(dy) < inner:
+            inner_half = math.isqrt(inner * inner - dy * dy - 1)
+            start = (half - inner_half) * 3
+            run[start:start + (2 * inner_half + 1) * 3] = fill * (2 * inner_half + 1)
+        rows.append((dy, -half, bytes(run)))
+    return tuple(rows)
+
+
+class _Raster:
+    """RGB pixel buffer with the few primitives the grid needs."""
+
+    def __init__(self, width: int, height: int, pixels: Optional[bytes] = None):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(pixels) if pixels is not None else bytearray(_rgb(BACKGROUND) * width * height)
+
+    def fill_rect(self, x1: int, y1: int, x2: int, y2: int, color: bytes):
+        x1, x2 = max(0, min(x1, x2)), min(self.width, max(x1, x2))
+        y1, y2 = max(0, min(y1, y2)), min(self.height, max(y1, y2))
+        if x1 >= x2:
+            return
+        run = color * (x2 - x1)
+        stride = self.width * 3
+        for y in range(y1, y2):
+            start = y * stride + x1 * 3
+            self.pixels[start:start + len(run)] = run
+
+    def outline_rect(self, x1: int, y1: int, x2: int, y2: int, color: bytes, width: int):
+        lo, hi = width // 2, (width + 1) // 2
+        self.fill_rect(x1 - lo, y1 - lo, x2 + hi, y1 + hi, color)
+        self.fill_rect(x1 - lo, y2 - lo, x2 + hi, y2 + hi, color)
+        self.fill_rect(x1 - lo, y1 - lo, x1 + hi, y2 + hi, color)
+        self.fill_rect(x2 - lo, y1 - lo, x2 + hi, y2 + hi, color)
+
+    def line(self, x1: int, y1: int, x2: int, y2: int, color: bytes, width: int):
+        """Axis-aligned line (all grid lines, walls and path moves are)."""
+        lo, hi = width // 2, (width + 1) // 2
+        if y1 == y2:
+            self.fill_rect(min(x1, x2), y1 - lo, max(x1, x2), y1 + hi, color)
+        else:
+            self.fill_rect(x1 - lo, min(y1, y2), x1 + hi, max(y1, y2), color)
+
+    def blit(self, x: int, y: int, sprite: "_Sprite"):
+        """Copy sprite rows (dy, dx, run) with their origin at (x, y)."""
+        stride = self.width * 3
+        pixels = self.pixels
+        first_dy, last_dy = sprite[0][0], sprite[-1][0]
+        half = len(sprite[len(sprite) // 2][2]) // 6
+        if (0 <= y + first_dy and y + last_dy < self.height
+                and 0 <= x - half and x + half < self.width):
+            # Fully inside (every dot on the grid is): no per-row clipping
+            base = y * stride + x * 3
+            for dy, dx, run in sprite:
+                start = base + dy * stride + dx * 3
+                pixels[start:start + len(run)] = run
+            return
+        for dy, dx, run in sprite:
+            py, px = y + dy, x + dx
+            if not 0 <= py < self.height:
+                continue
+            if px < 0:
+                run, px = run[-px * 3:], 0
+            run = run[:(self.width - px) * 3]
+            start = py * stride + px * 3
+            pixels[start:start + len(run)] = run
+
+    def circle(self, cx: int, cy: int, radius: int, fill: bytes, outline: bytes, width: int):
+        """Filled circle with an outline ring, from the cached sprite."""
+        self.blit(cx, cy, _circle_sprite(radius, width, fill, outline))
+
+    def text(self, cx: int, cy: int, text: str, color: bytes):
+        """Centered digits in the built-in bitmap font."""
+        glyph_w, gap = 3 * _GLYPH_SCALE, _GLYPH_SCALE
+        total_w = len(text) * glyph_w + (len(text) - 1) * gap
+        x0 = cx - total_w // 2
+        y0 = cy - (5 * _GLYPH_SCALE) // 2
+        for ch in text:
+            for row, bits in enumerate(_DIGITS.get(ch, ())):
+                for col, bit in enumerate(bits):
+                    if bit == "1":
+                        px = x0 + col * _GLYPH_SCALE
+                        py = y0 + row * _GLYPH_SCALE
+                        self.fill_rect(px, py, px + _GLYPH_SCALE, py + _GLYPH_SCALE, color)
+            x0 += glyph_w + gap
+
+    def to_png(self, compress_level: int = 6) -> bytes:
+        stride = self.width * 3
+        rows = memoryview(self.pixels)
+        # Each row is prefixed with filter type 0 (none)
+        raw = b"\x00" + b"\x00".join(rows[y:y + stride] for y in range(0, len(rows), stride))
+
+        def chunk(tag: bytes, data: bytes) -> bytes:
+            return (struct.pack(">I", len(data)) + tag + data
+                    + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+        header = struct.pack(">IIBBBBB", self.width, self.height, 8, 2, 0, 0, 0)
+        return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+                + chunk(b"IDAT", zlib.compress(raw, compress_level)) + chunk(b"IEND", b""))
+
+
+@lru_cache(maxsize=16)
+def _png_base(rows: int, cols: int) -> bytes:
+    """Static layer per grid size: background and empty cells."""
+    w, h = canvas_size(rows, cols)
+    raster = _Raster(w, h)
+    fill, outline = _rgb(EMPTY_FILL), _rgb(EMPTY_OUTLINE)
+    for r in range(rows):
+        for c in range(cols):
+            x1, y1, x2, y2 = cell_box(r, c)
+            raster.fill_rect(x1, y1, x2, y2, fill)
+            raster.outline_rect(x1, y1, x2, y2, outline, 1)
+    return bytes(raster.pixels)
+
+
+def _png_puzzle(parse_result: GridParseResult) -> _Raster:
+    w, h = canvas_size(parse_result.rows, parse_result.cols)
+    raster = _Raster(w, h, _png_base(parse_result.rows, parse_result.cols))
+    fill, outline = _rgb(NUMBER_FILL), _rgb(NUMBER_OUTLINE)
+    for r, row in enumerate(parse_result.grid):
+        for c, val in enumerate(row):
+            if val > 0:
+                x1, y1, x2, y2 = cell_box(r, c)
+                raster.fill_rect(x1, y1, x2, y2, fill)
+                raster.outline_rect(x1, y1, x2, y2, outline, 2)
+    wall = _rgb(WALL_COLOR)
+    for edge in parse_result.blocked_edges:
+        seg = wall_segment(edge)
+        if seg:
+            raster.line(*seg, wall, WALL_WIDTH)
+    return raster
+
+
+def _png_numbers(raster: _Raster, parse_result: GridParseResult):
+    color = _rgb(NUMBER_TEXT)
+    for r, row in enumerate(parse_result.grid):
+        for c, val in enumerate(row):
+            if val > 0:
+                raster.text(*cell_center(r, c), str(val), color)
+
+
+def _png_dot(raster: _Raster, cell: Cell, head: bool):
+    fill, outline = (HEAD_FILL, HEAD_OUTLINE) if head else (DOT_FILL, DOT_OUTLINE)
+    raster.circle(*cell_center(*cell), CELL_SIZE // 4, _rgb(fill), _rgb(outline), 2)
+
+
+def render_png(parse_result: GridParseResult, path: List[Cell], step: Optional[int] = None,
+               compress_level: int = 6) -> bytes:
+    """PNG of the puzzle with the path drawn up to step (default: full path)."""
+    shown = _visible_path(path, step)
+    raster = _png_puzzle(parse_result)
+    color = _rgb(PATH_COLOR)
+    for a, b in zip(shown, shown[1:]):
+        raster.line(*cell_center(*a), *cell_center(*b), color, PATH_WIDTH)
+    for i, cell in enumerate(shown):
+        _png_dot(raster, cell, head=(i == len(shown) - 1))
+    _png_numbers(raster, parse_result)
+    return raster.to_png(compress_level)
+
+
+def iter_png_frames(parse_result: GridParseResult, path: List[Cell],
+                    compress_level: int = 6) -> Iterator[bytes]:
+    """PNG per step (0..len(path)-1), drawn incrementally on one raster.
+
+    Encoding dominates here (each frame compresses the whole image); a lower
+    compress_level trades file size for speed.
+    """
+    if not path:
+        return
+    raster = _png_puzzle(parse_result)
+    color = _rgb(PATH_COLOR)
+    for i, cell in enumerate(path):
+        if i > 0:
+            prev = path[i - 1]
+            raster.line(*cell_center(*prev), *cell_center(*cell), color, PATH_WIDTH)
+            _png_dot(raster, prev, head=False)
+        _png_dot(raster, cell, head=True)
+        _png_numbers(raster, parse_result)
+        yield raster.to_png(compress_level)
+
+
+def save_render(filename: str, parse_result: GridParseResult, path: List[Cell],
+                step: Optional[int] = None, animated: bool = False) -> None:
+    """Write .svg or .png by extension; animated is SVG only (see iter_png_frames)."""
+    if filename.lower().endswith(".svg"):
+        svg = render_animated_svg(parse_result, path) if animated else render_svg(parse_result, path, step)
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(svg)
+    elif filename.lower().endswith(".png"):
+        if animated:
+            raise ValueError("Animated output needs .svg; use iter_png_frames for PNG frames")
+        with open(filename, "wb") as f:
+            f.write(render_png(parse_result, path, step))
+    else:
+        raise ValueError(f"Unsupported output format: {filename}")
@@ -1,11 +1,39 @@
 """Zip Game Solver."""
 
-from typing import List, Tuple, Optional, Dict, Set
+import threading
+from typing import Callable, List, Tuple, Optional, Dict, Set
 
 from models import GridParseResult
 
+# Machine-readable reasons reported by ZipSolverCore.check_feasibility
+MISSING_START = "MISSING_START"
+MISSING_NUMBERS = "MISSING_NUMBERS"
+UNREACHABLE_CHECKPOINT = "UNREACHABLE_CHECKPOINT"
+PARITY = "PARITY"
+DEAD_ENDS = "DEAD_ENDS"
+CUT_VERTEX = "CUT_VERTEX"
+
+# Search configurations understood by ZipSolverCore
+ENGINES = ("recursive", "stack")
+ORDERINGS = ("fixed", "warnsdorff", "target")
+PRUNINGS = ("dead_end", "connectivity")
+
+# Nodes between progress callbacks / cancellation checks
+PROGRESS_INTERVAL = 5000
+
 class ZipSolverCore:
-    def __init__(self, grid: List[List[int]], blocked_edges: Optional[Set[frozenset]] = None):
+    def __init__(self, grid: List[List[int]], blocked_edges: Optional[Set[frozenset]] = None,
+                 engine: str = "recursive", ordering: str = "fixed",
+                 pruning: Tuple[str, ...] = ()):
+        self.configure(engine, ordering, pruning)
+        self.nodes_expanded = 0
+        self._progress_callback: Optional[Callable[[int], None]] = None
+        self._cancel_event: Optional[threading.Event] = None
+        self._cancelled = False
+        # Filled by check_feasibility; the grid never changes, so it runs once
+        self.reachable_cells: Optional[Set[Tuple[int, int]]] = None
+        self._feasibility: Optional[Tuple[bool, str]] = None
+
         self.grid = grid
         self.rows = len(grid)
         self.cols = len(grid[0]) if self.rows else 0
@@ -18,8 +46,28 @@ class ZipSolverCore:
         self.blocked = blocked_edges or set()
         self.max_number = max(self.numbered_cells.keys()) if self.numbered_cells else 0
 
-    def _neighbors(self, r: int, c: int) -> List[Tuple[int, int]]:
-        """Get valid neighbors considering walls and grid boundaries."""
+        # Wall-aware adjacency, computed once instead of per move
+        self._adjacency = {
+            (r, c): self._compute_neighbors(r, c)
+            for r in range(self.rows)
+            for c in range(self.cols)
+        }
+
+    def configure(self, engine: str = "recursive", ordering: str = "fixed",
+                  pruning: Tuple[str, ...] = ()):
+        """Set the search configuration (see ENGINES, ORDERINGS, PRUNINGS)."""
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of {ENGINES}")
+        if ordering not in ORDERINGS:
+            raise ValueError(f"Unknown ordering {ordering!r}, expected one of {ORDERINGS}")
+        unknown = set(pruning) - set(PRUNINGS)
+        if unknown:
+            raise ValueError(f"Unknown pruning {sorted(unknown)}, expected from {PRUNINGS}")
+        self.engine = engine
+        self.ordering = ordering
+        self.pruning = tuple(pruning)
+
+    def _compute_neighbors(self, r: int, c: int) -> List[Tuple[int, int]]:
         neighbors = []
         for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
             nr, nc = r + dr, c + dc
@@ -28,6 +76,10 @@ class ZipSolverCore:
                     neighbors.append((nr, nc))
         return neighbors
 
+    def _neighbors(self, r: int, c: int) -> List[Tuple[int, int]]:
+        """Get valid neighbors considering walls and grid boundaries."""
+        return self._adjacency[(r, c)]
+
     def get_reachable_cells(self, start: Tuple[int, int]) -> Set[Tuple[int, int]]:
         """BFS to find all reachable cells from start position."""
         reachable = set()
@@ -43,26 +95,253 @@ class ZipSolverCore:
                     queue.append(nb)
         return reachable
 
+    def _cut_vertex_violation(self, cells: Set[Tuple[int, int]], start: Tuple[int, int],
+                              end: Tuple[int, int]) -> Optional[str]:
+        """Cut-vertex check in a single iterative Tarjan DFS rooted at start.
+
+        Each DFS subtree is the disc interval [disc[c], last[c]], so the two
+        sides of a cut vertex and the numbers on each side come from subtree
+        minima and disc-order prefix/suffix maxima instead of a BFS per cut
+        vertex. Bridges are covered through their non-leaf ends, which are
+        cut vertices. Returns a reason string or None.
+        """
+        inf = float("inf")
+        order = [start]
+        disc = {start: 0}
+        low = {start: 0}
+        last = {}
+        parent = {start: None}
+        separated = {start: []}  # children whose subtree a vertex cuts off
+        sub_min = {start: self.grid[start[0]][start[1]] or inf}
+        stack = [(start, iter(self._adjacency[start]))]
+
+        while stack:
+            node, it = stack[-1]
+            advanced = False
+            for nb in it:
+                if nb not in cells:
+                    continue
+                if nb not in disc:
+                    disc[nb] = low[nb] = len(order)
+                    order.append(nb)
+                    parent[nb] = node
+                    separated[nb] = []
+                    sub_min[nb] = self.grid[nb[0]][nb[1]] or inf
+                    stack.append((nb, iter(self._adjacency[nb])))
+                    advanced = True
+                    break
+                if nb != parent[node]:
+                    low[node] = min(low[node], disc[nb])
+            if advanced:
+                continue
+            stack.pop()
+            last[node] = len(order) - 1
+            par = parent[node]
+            if par is not None:
+                low[par] = min(low[par], low[node])
+                sub_min[par] = min(sub_min[par], sub_min[node])
+                if par == start or low[node] >= disc[par]:
+                    separated[par].append(node)
 
+        # Largest number outside a subtree interval, from disc-order prefix/suffix maxima
+        n = len(order)
+        prefix_max, suffix_max = [0] * n, [0] * (n + 1)
+        running = 0
+        for i, (r, c) in enumerate(order):
+            running = max(running, self.grid[r][c])
+            prefix_max[i] = running
+        for i in range(n - 1, -1, -1):
+            r, c = order[i]
+            suffix_max[i] = max(suffix_max[i + 1], self.grid[r][c])
 
+        for cut in sorted(separated):
+            children = separated[cut]
+            if cut == start:
+                if len(children) < 2:
+                    continue  # root is a cut vertex only with 2+ DFS children
+                parts = len(children)
+            else:
+                if not children:
+                    continue
+                parts = len(children) + 1  # plus the side containing the root
+            if parts > 2:
+                return f"{CUT_VERTEX}: {cut} splits the grid into {parts} parts"
+            if cut in (start, end):
+                return f"{CUT_VERTEX}: Endpoint {cut} splits the grid"
 
-    def solve_zip_game(self) -> Optional[List[Tuple[int, int]]]:
-        """Solve using DFS backtracking."""
+            # Two sides: the rest (holds start) and the subtree of child
+            child = children[0]
+            lo, hi = disc[child], last[child]
+            if not lo <= disc[end] <= hi:
+                return f"{CUT_VERTEX}: 1 and {self.max_number} on the same side of {cut}"
+            before_max = max(prefix_max[lo - 1], suffix_max[hi + 1])
+            after_min = sub_min[child]
+            cut_val = self.grid[cut[0]][cut[1]]
+            if cut_val > 0:
+                before_max = max(before_max, cut_val)
+                after_min = min(after_min, cut_val)
+            if before_max > after_min:
+                return (f"{CUT_VERTEX}: {cut} forces number {before_max} "
+                        f"before {after_min}")
+        return None
+
+    def check_feasibility(self) -> tuple[bool, str]:
+        """Cheap necessary conditions, checked before any search.
+
+        Returns (True, "Feasible") or (False, "<REASON>: details") where
+        REASON is one of the module-level reason constants. The result is
+        cached, so solve_zip_game does not repeat it after a caller has run it.
+        """
+        if self._feasibility is None:
+            self._feasibility = self._run_feasibility_checks()
+        return self._feasibility
+
+    def _run_feasibility_checks(self) -> Tuple[bool, str]:
         if 1 not in self.numbered_cells:
-            return None
+            return False, f"{MISSING_START}: No cell numbered 1"
+
+        missing = [n for n in range(1, self.max_number + 1) if n not in self.numbered_cells]
+        if missing:
+            return False, f"{MISSING_NUMBERS}: Numbers {missing} not on grid"
 
         start = self.numbered_cells[1]
+        end = self.numbered_cells[self.max_number]
         reachable = self.get_reachable_cells(start)
+        self.reachable_cells = reachable
         total_cells = len(reachable)
-        
-        # Verify all numbered cells are reachable
-        for num, pos in self.numbered_cells.items():
+
+        # Checkpoints in a different component than #1
+        for num, pos in sorted(self.numbered_cells.items()):
             if pos not in reachable:
-                return None
+                return False, f"{UNREACHABLE_CHECKPOINT}: Number {num} at {pos} not reachable from 1"
+
+        if total_cells == 1:
+            return True, "Feasible"
+        if start == end:
+            return False, f"{PARITY}: Path of {total_cells} cells cannot start and end at {start}"
+
+        # Checkerboard parity: a path alternates colours
+        black = sum(1 for r, c in reachable if (r + c) % 2 == 0)
+        white = total_cells - black
+        start_black = sum(start) % 2 == 0
+        end_black = sum(end) % 2 == 0
+        if abs(black - white) > 1:
+            return False, f"{PARITY}: {black} black vs {white} white free cells"
+        if black == white and start_black == end_black:
+            return False, f"{PARITY}: Even cell count but 1 and {self.max_number} share a colour"
+        if black != white and not (start_black == end_black == (black > white)):
+            return False, f"{PARITY}: 1 and {self.max_number} must both be on the majority colour"
+
+        # Degree-1 cells can only be path endpoints
+        dead_ends = [pos for pos in reachable if len(self._neighbors(*pos)) == 1]
+        if len(dead_ends) > 2:
+            return False, f"{DEAD_ENDS}: {len(dead_ends)} degree-1 cells {sorted(dead_ends)}"
+        for pos in dead_ends:
+            if pos not in (start, end):
+                return False, f"{DEAD_ENDS}: Degree-1 cell {pos} is not an endpoint"
+
+        # Cut vertices split the path into a "before" side and an "after" side
+        violation = self._cut_vertex_violation(reachable, start, end)
+        if violation:
+            return False, violation
+
+        return True, "Feasible"
 
+    def _order_moves(self, moves: List[Tuple[int, int]], visited: Set[Tuple[int, int]],
+                     next_target: int) -> List[Tuple[int, int]]:
+        """Order candidate moves according to self.ordering."""
+        if self.ordering == "warnsdorff":
+            # Fewest onward moves first
+            return sorted(moves, key=lambda nb: sum(
+                1 for nn in self._adjacency[nb] if nn not in visited))
+        if self.ordering == "target" and next_target in self.numbered_cells:
+            tr, tc = self.numbered_cells[next_target]
+            return sorted(moves, key=lambda nb: abs(nb[0] - tr) + abs(nb[1] - tc))
+        return moves
+
+    def _is_stranded(self, cell: Tuple[int, int], head: Tuple[int, int],
+                     visited: Set[Tuple[int, int]], end: Tuple[int, int]) -> bool:
+        """True if an unvisited cell can no longer be passed through (or ended on)."""
+        free = 0
+        for nb in self._adjacency[cell]:
+            if nb == head or nb not in visited:
+                free += 1
+        return free < (1 if cell == end else 2)
+
+    def _should_prune(self, head: Tuple[int, int], prev: Optional[Tuple[int, int]],
+                      visited: Set[Tuple[int, int]], end: Tuple[int, int],
+                      remaining: int) -> bool:
+        """Apply the configured pruning rules after moving to head."""
+        if remaining == 0:
+            return False
+
+        if "dead_end" in self.pruning:
+            # Only cells next to the old or new head changed their free degree
+            around = self._adjacency[head] + (self._adjacency[prev] if prev else [])
+            for cell in around:
+                if cell not in visited and self._is_stranded(cell, head, visited, end):
+                    return True
+
+        if "connectivity" in self.pruning:
+            # Unvisited cells must all still be reachable from the head
+            seen = set()
+            queue = [nb for nb in self._adjacency[head] if nb not in visited]
+            seen.update(queue)
+            while queue:
+                curr = queue.pop()
+                for nb in self._adjacency[curr]:
+                    if nb not in visited and nb not in seen:
+                        seen.add(nb)
+                        queue.append(nb)
+            if len(seen) != remaining:
+                return True
+
+        return False
+
+    def _report_progress(self) -> bool:
+        """Called every PROGRESS_INTERVAL nodes; returns True to abort the search."""
+        if self._progress_callback:
+            self._progress_callback(self.nodes_expanded)
+        if self._cancel_event is not None and self._cancel_event.is_set():
+            self._cancelled = True
+        return self._cancelled
+
+    def solve_zip_game(self, progress_callback: Optional[Callable[[int], None]] = None,
+                       cancel_event: Optional[threading.Event] = None
+                       ) -> Optional[List[Tuple[int, int]]]:
+        """Solve using DFS backtracking with the configured engine.
+
+        progress_callback receives the node count every PROGRESS_INTERVAL
+        nodes; setting cancel_event stops the search and returns None.
+        """
+        self.nodes_expanded = 0
+        self._progress_callback = progress_callback
+        self._cancel_event = cancel_event
+        self._cancelled = False
+        feasible, _ = self.check_feasibility()
+        if not feasible:
+            return None
+
+        # Feasibility already verified every number is reachable from #1
+        start = self.numbered_cells[1]
+        total_cells = len(self.reachable_cells)
+
+        if self.engine == "stack":
+            return self._solve_stack(start, total_cells)
+        return self._solve_recursive(start, total_cells)
+
+    def _solve_recursive(self, start: Tuple[int, int],
+                         total_cells: int) -> Optional[List[Tuple[int, int]]]:
+        """Original recursive DFS (copies the path at every step)."""
+        end = self.numbered_cells[self.max_number]
 
         def backtrack(path: List[Tuple[int, int]], next_target: int, 
                      visited: Set[Tuple[int, int]]) -> Optional[List[Tuple[int, int]]]:
+            if self._cancelled:
+                return None
+            self.nodes_expanded += 1
+            if self.nodes_expanded % PROGRESS_INTERVAL == 0 and self._report_progress():
+                return None
             current_pos = path[-1]
             current_r, current_c = current_pos
             
@@ -75,19 +354,21 @@ class ZipSolverCore:
             
             # Check completion AFTER number match: full coverage, all numbers, ENDS at max_number pos
             if len(path) == total_cells and next_target > self.max_number:
-                max_pos = self.numbered_cells[self.max_number]
-                if current_pos == max_pos:
+                if current_pos == end:
                     return path
                 return None
+
+            if self.pruning:
+                prev = path[-2] if len(path) > 1 else None
+                if self._should_prune(current_pos, prev, visited, end, total_cells - len(path)):
+                    return None
             
-            # Get neighbors in fixed order (pure DFS)
             neighbors = [nb for nb in self._neighbors(current_r, current_c) if nb not in visited]
             
             if not neighbors:
                 return None
 
-            # Try neighbors in fixed order (no heuristic sorting/pruning)
-            for neighbor in neighbors:
+            for neighbor in self._order_moves(neighbors, visited, next_target):
                 visited.add(neighbor)
                 result = backtrack(path + [neighbor], next_target, visited)
                 if result:
@@ -100,6 +381,60 @@ class ZipSolverCore:
         solution = backtrack([start], 1, initial_visited)
         return solution
 
+    def _solve_stack(self, start: Tuple[int, int],
+                     total_cells: int) -> Optional[List[Tuple[int, int]]]:
+        """Iterative DFS on an explicit stack; path is extended in place and
+        there is no recursion limit on large grids."""
+        end = self.numbered_cells[self.max_number]
+        path = [start]
+        visited = {start}
+        # Per depth: (next_target after this cell, iterator over untried moves)
+        stack = []
+
+        def enter(pos: Tuple[int, int], next_target: int) -> bool:
+            """Visit path[-1]; push its moves. Returns True when solved."""
+            self.nodes_expanded += 1
+            if self.nodes_expanded % PROGRESS_INTERVAL == 0:
+                self._report_progress()
+            val = self.grid[pos[0]][pos[1]]
+            if val > 0:
+                if val != next_target:
+                    stack.append((next_target, iter(())))
+                    return False
+                next_target += 1
+            if len(path) == total_cells and next_target > self.max_number:
+                if pos == end:
+                    return True
+                stack.append((next_target, iter(())))
+                return False
+            if self.pruning:
+                prev = path[-2] if len(path) > 1 else None
+                if self._should_prune(pos, prev, visited, end, total_cells - len(path)):
+                    stack.append((next_target, iter(())))
+                    return False
+            moves = [nb for nb in self._adjacency[pos] if nb not in visited]
+            stack.append((next_target, iter(self._order_moves(moves, visited, next_target))))
+            return False
+
+        if enter(start, 1):
+            return path
+
+        while stack:
+            if self._cancelled:
+                return None
+            next_target, moves = stack[-1]
+            move = next(moves, None)
+            if move is None:
+                stack.pop()
+                visited.discard(path.pop())
+                continue
+            path.append(move)
+            visited.add(move)
+            if enter(move, next_target):
+                return path
+
+        return None
+
     def validate_solution(self, sol: List[Tuple[int, int]]) -> tuple[bool, str]:
         """Validate the solution path."""
         if not sol:
@@ -7,6 +7,11 @@ import tkinter as tk
 from tkinter import ttk
 from typing import List, Tuple
 from models import GridParseResult
+from renderer import (
+    CELL_SIZE, MARGIN, EMPTY_FILL, EMPTY_OUTLINE, NUMBER_FILL, NUMBER_OUTLINE, NUMBER_TEXT,
+    WALL_COLOR, WALL_WIDTH, PATH_COLOR, PATH_WIDTH, DOT_FILL, DOT_OUTLINE, HEAD_FILL, HEAD_OUTLINE,
+    wall_segment,
+)
 
 
 class ZipGameVisualizer:
@@ -21,8 +26,8 @@ class ZipGameVisualizer:
         self.solution_path = solution_path or []
 
         # UI state
-        self.cell_size = 55
-        self.margin = 40
+        self.cell_size = CELL_SIZE
+        self.margin = MARGIN
         self.current_step = 0
         self.animation_speed = 350
         self.playing = False
@@ -111,28 +116,18 @@ class ZipGameVisualizer:
 
                 if val > 0:
                     self.canvas.create_rectangle(x1, y1, x2, y2,
-                                                 fill="#e3f2fd", outline="#2196f3", width=2)
+                                                 fill=NUMBER_FILL, outline=NUMBER_OUTLINE, width=2)
                     self.canvas.create_text((x1 + x2) / 2, (y1 + y2) / 2,
-                                            text=str(val), font=("Arial", 14, "bold"), fill="#1976d2")
+                                            text=str(val), font=("Arial", 14, "bold"), fill=NUMBER_TEXT)
                 else:
                     self.canvas.create_rectangle(x1, y1, x2, y2,
-                                                 fill="#f5f5f5", outline="#bbbbbb", width=1)
+                                                 fill=EMPTY_FILL, outline=EMPTY_OUTLINE, width=1)
 
         # Inline walls
         for edge in self.blocked_edges:
-            (r1, c1), (r2, c2) = list(edge)
-            if r1 == r2:  # Vertical
-                col = max(c1, c2)
-                x = self.margin + col * self.cell_size
-                y1_ = self.margin + r1 * self.cell_size
-                y2_ = y1_ + self.cell_size
-                self.canvas.create_line(x, y1_, x, y2_, fill="black", width=4)
-            elif c1 == c2:  # Horizontal
-                row = max(r1, r2)
-                y = self.margin + row * self.cell_size
-                x1_ = self.margin + c1 * self.cell_size
-                x2_ = x1_ + self.cell_size
-                self.canvas.create_line(x1_, y, x2_, y, fill="black", width=4)
+            seg = wall_segment(edge, self.cell_size, self.margin)
+            if seg:
+                self.canvas.create_line(*seg, fill=WALL_COLOR, width=WALL_WIDTH)
 
         # Draw path
         if self.solution_path and self.current_step > 0:
@@ -168,7 +163,7 @@ class ZipGameVisualizer:
             x2 = self.margin + c2 * self.cell_size + self.cell_size // 2
             y2 = self.margin + r2 * self.cell_size + self.cell_size // 2
 
-            self.canvas.create_line(x1, y1, x2, y2, fill="#4caf50", width=3)
+            self.canvas.create_line(x1, y1, x2, y2, fill=PATH_COLOR, width=PATH_WIDTH)
 
         # Draw small center dots
         for i, (r, c) in enumerate(path):
@@ -176,9 +171,9 @@ class ZipGameVisualizer:
             cy = self.margin + r * self.cell_size + self.cell_size // 2
             radius = self.cell_size // 4
             if i == len(path) - 1:
-                fill, outline = "#f44336", "#d32f2f"
+                fill, outline = HEAD_FILL, HEAD_OUTLINE
             else:
-                fill, outline = "#c8e6c9", "#388e3c"
+                fill, outline = DOT_FILL, DOT_OUTLINE
             self.canvas.create_oval(
                 cx - radius, cy - radius, cx + radius, cy + radius,
                 fill=fill, outline=outline, width=2
@@ -194,7 +189,7 @@ class ZipGameVisualizer:
                 y2 = y1 + self.cell_size
                 self.canvas.create_text(
                     (x1 + x2)/2, (y1 + y2)/2,
-                    text=str(val), font=("Arial", 14, "bold"), fill="#1976d2"
+                    text=str(val), font=("Arial", 14, "bold"), fill=NUMBER_TEXT
                 )
 
 
@@ -1,28 +1,61 @@
 """Background worker for browser automation."""
 
-import queue
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
-
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
-
+import threading
 import time
 import traceback
+from typing import Callable, Optional
 
-from extractor import extract_zip_grid_improved
-from solver import ZipSolverCore
+from dispatcher import build_solver
 from models import GridParseResult
 
-result_queue = queue.Queue()
+def solve_parse_result(parse_result: GridParseResult,
+                       progress_callback: Optional[Callable[[int], None]] = None,
+                       cancel_event: Optional[threading.Event] = None):
+    """Solve a parsed puzzle; returns (result_type, parse_result, solution, message)."""
+    solver = build_solver(parse_result)
+    feasible, reason = solver.check_feasibility()
+    if not feasible:
+        return ("NO_SOLUTION", parse_result, None, reason)
+    solution = solver.solve_zip_game(progress_callback, cancel_event)
+
+    if solution:
+        is_valid, message = solver.validate_solution(solution)
+        if is_valid:
+            return ("SUCCESS", parse_result, solution, message)
+        return ("INVALID", parse_result, solution, message)
+    if cancel_event is not None and cancel_event.is_set():
+        return ("CANCELLED", parse_result, None, "Solve cancelled")
+    return ("NO_SOLUTION", parse_result, None, "No solution found")
 
-def worker_extract_and_solve():
-    """Worker function to extract and solve the puzzle."""
+def worker_extract_and_solve(progress_callback: Optional[Callable[[int], None]] = None,
+                             cancel_event: Optional[threading.Event] = None):
+    """Worker function to extract and solve the puzzle.
+
+    Runs on a background thread; returns the same tuple as solve_parse_result.
+    cancel_event is also checked between the browser steps, so a cancel
+    during start-up or page load skips extraction.
+    """
+    def cancelled() -> bool:
+        return cancel_event is not None and cancel_event.is_set()
+
+    cancelled_result = ("CANCELLED", None, None, "Solve cancelled")
     driver = None
     try:
+        # Browser stack is imported on first live solve only, so test mode
+        # and solver-only callers never pay for Selenium.
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.common.by import By
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        from extractor import extract_zip_grid_improved
+
+        if cancelled():
+            return cancelled_result
+
         print("🚀 Starting browser...")
         opts = Options()
         opts.add_argument("--disable-dev-shm-usage")
@@ -35,10 +68,18 @@ def worker_extract_and_solve():
             options=opts
         )
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        if cancelled():
+            return cancelled_result
         
         print("🌐 Navigating to LinkedIn Zip...")
         driver.get("https://www.linkedin.com/games/zip/")
-        time.sleep(3)
+        # Wait for the page to settle, waking early on cancel
+        if cancel_event is not None:
+            cancel_event.wait(3)
+        else:
+            time.sleep(3)
+        if cancelled():
+            return cancelled_result
 
         # Handle iframe if present
         try:
@@ -50,24 +91,17 @@ def worker_extract_and_solve():
         except Exception:
             print("ℹ️ No iframe found")
 
+        if cancelled():
+            return cancelled_result
+
         # Extract and solve
         parse_result = extract_zip_grid_improved(driver)
-        solver = ZipSolverCore(parse_result.grid, parse_result.blocked_edges)
-        solution = solver.solve_zip_game()
-        
-        if solution:
-            is_valid, message = solver.validate_solution(solution)
-            if is_valid:
-                result_queue.put(("SUCCESS", parse_result, solution, message))
-            else:
-                result_queue.put(("INVALID", parse_result, solution, message))
-        else:
-            result_queue.put(("NO_SOLUTION", parse_result, None, "No solution found"))
+        return solve_parse_result(parse_result, progress_callback, cancel_event)
             
     except Exception as e:
         error_msg = f"Error: {e}\n{traceback.format_exc()}"
         print(error_msg)
-        result_queue.put(("ERROR", None, None, error_msg))
+        return ("ERROR", None, None, error_msg)
     finally:
         if driver:
             driver.quit()